@@ -7,6 +7,7 @@ Command-line interface for Inventory System
 from __future__ import annotations
 
 import argparse
+import heapq
 import json
 import shutil
 import sys
@@ -455,7 +456,7 @@ def parse_command(
                     if len(category_mappings) > 3:
                         print(f"   ... and {len(category_mappings) - 3} more mappings")
                 elif category_counts:
-                    top_categories = sorted(category_counts.items(), key=lambda x: -x[1])[:5]
+                    top_categories = heapq.nlargest(5, category_counts.items(), key=lambda x: x[1])
                     print(f"   Top categories: {', '.join(f'{c}({n})' for c, n in top_categories)}")
             else:
                 print("   No categories found in inventory")
@@ -35,22 +35,39 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 import re
+import sys
+import tempfile
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from itertools import chain
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-# Caches keyed by (id(vocab), lang) — valid as long as the vocab dict is not mutated.
+try:  # optional, inventory-md[fast]
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+# Caches keyed by id(vocab) (the alias map by (id(vocab), lang)).  The alias map
+# is valid only as long as the vocab dict is not mutated; the label, leaf and
+# ancestor caches also store len(vocab) and rebuild when it changes, so adding or
+# removing concepts invalidates them.  In-place edits of existing concepts, or
+# replacing a key without changing the count, are still not detected.
 # Safe in normal use because the vocabulary dict is loaded once and lives for the
 # process; short-lived dicts (mostly in tests) can however reuse a freed id() and
 # get a stale hit — call clear_caches() between such uses.
 _alias_map_cache: dict[tuple, dict[str, str]] = {}
-_label_index_cache: dict[int, dict[str, str]] = {}
+_label_index_cache: dict[int, tuple[int, dict[str, str]]] = {}  # id -> (len, index)
+_leaf_index_cache: dict[int, tuple[int, dict[str, str]]] = {}  # id -> (len, index)
+_ancestor_cache: dict[int, tuple[int, dict[str, frozenset[str]]]] = {}  # id -> (len, {cid: ancestors})
 
 
 def clear_caches() -> None:
-    """Drop the id()-keyed label/alias index caches.
+    """Drop the id()-keyed label/alias/leaf index and ancestor caches.
 
     Only relevant when many short-lived vocabulary dicts are created in one
     process (e.g. a test suite), where a reused id() could otherwise return a
@@ -58,6 +75,8 @@ def clear_caches() -> None:
     """
     _alias_map_cache.clear()
     _label_index_cache.clear()
+    _leaf_index_cache.clear()
+    _ancestor_cache.clear()
 
 
 if TYPE_CHECKING:
@@ -70,6 +89,12 @@ CATEGORY_BY_SOURCE_ID = "category_by_source"
 
 _EAN_CACHE_TTL_DAYS = 7
 _LOOKUP_CACHE_TTL_DAYS = 7
+_RESOLVE_MAX_WORKERS = 8  # concurrent /api/skos/hierarchy requests
+_LOOKUP_MAX_WORKERS = 8  # concurrent /api/lookup requests
+
+# Used once per label in enrich_categories_via_lookup()
+_LANG_TAG_PREFIX_RE = re.compile(r"^[a-z]{2,3}:")  # OFF-style "en:" / "nb:" prefix
+_CACHE_KEY_UNSAFE_RE = re.compile(r"[^\w.-]")  # characters not safe in a cache filename
 
 # Human-friendly labels for known source identifiers
 _SOURCE_LABELS: dict[str, str] = {
@@ -82,10 +107,33 @@ _SOURCE_LABELS: dict[str, str] = {
 }
 
 
+def _intern(value: Any) -> Any:
+    """``sys.intern`` a concept ID or path; pass non-strings (e.g. YAML ints) through.
+
+    Category IDs recur as dict keys and in every broader/narrower list; interning
+    them keeps one copy per ID and lets dict probes succeed on identity.
+    """
+    return sys.intern(value) if type(value) is str else value
+
+
+def _json_loads(raw: bytes) -> Any:
+    """Parse JSON bytes with orjson when installed (inventory-md[fast]), else the stdlib."""
+    if _orjson is not None:
+        return _orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _intern_refs(concept: Concept) -> None:
+    """Intern a tingbok concept's ID and broader/narrower references in place."""
+    concept.id = sys.intern(concept.id)
+    concept.broader = [_intern(b) for b in concept.broader]
+    concept.narrower = [_intern(n) for n in concept.narrower]
+
+
 def _cache_read(path: Path, ttl_days: int) -> dict | None:
     """Read a JSON cache entry; return None if missing or expired."""
     try:
-        entry = json.loads(path.read_text(encoding="utf-8"))
+        entry = _json_loads(path.read_bytes())
         cached_at = datetime.fromisoformat(entry["cached_at"])
         age = datetime.now(timezone.utc) - cached_at.astimezone(timezone.utc)
         if age.days < ttl_days:
@@ -99,7 +147,17 @@ def _cache_write(path: Path, **fields: Any) -> None:
     """Write a JSON cache entry, adding a ``cached_at`` timestamp."""
     path.parent.mkdir(parents=True, exist_ok=True)
     entry = {"cached_at": datetime.now(timezone.utc).isoformat(), **fields}
-    path.write_text(json.dumps(entry, ensure_ascii=False), encoding="utf-8")
+    # Lookups write from worker threads, and two labels can share a cache file:
+    # write a temp file next to it and rename it into place, so a reader never
+    # sees a half-written entry.
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(json.dumps(entry, ensure_ascii=False))
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
 
 
 class TingbokUnavailableError(RuntimeError):
@@ -252,11 +310,12 @@ def fetch_vocabulary_from_tingbok(url: str, session: niquests.Session | None = N
             concept = Concept.from_dict(raw)
             for u in raw_source_uris:
                 src = _uri_to_source(u)
-                if src and src not in concept.source_uris:
-                    concept.source_uris[src] = u
+                if src:
+                    concept.source_uris.setdefault(src, u)  # first URI per source wins
             concept.source_paths = raw_source_paths
             concept.path_aliases = raw_path_aliases
-            concepts[concept_id] = concept
+            _intern_refs(concept)
+            concepts[concept.id] = concept
         except Exception as e:
             logger.warning("Skipping malformed concept '%s' from tingbok: %s", concept_id, e)
 
@@ -302,11 +361,12 @@ def resolve_vocabulary_from_tingbok(
             concept = Concept.from_dict(raw)
             for u in raw_source_uris:
                 src = _uri_to_source(u)
-                if src and src not in concept.source_uris:
-                    concept.source_uris[src] = u
+                if src:
+                    concept.source_uris.setdefault(src, u)  # first URI per source wins
             concept.source_paths = raw_source_paths
             concept.path_aliases = raw_path_aliases
-            concepts[concept_id] = concept
+            _intern_refs(concept)
+            concepts[concept.id] = concept
         except Exception as e:
             logger.warning("Skipping malformed concept '%s' from tingbok resolve: %s", concept_id, e)
 
@@ -333,12 +393,8 @@ def expand_languages_with_aliases(languages: list[str]) -> list[str]:
 
     Returns a new list with alias languages appended (no duplicates).
     """
-    expanded = list(languages)
-    for lang in languages:
-        for alias in LANGUAGE_CODE_ALIASES.get(lang, []):
-            if alias not in expanded:
-                expanded.append(alias)
-    return expanded
+    aliases = chain.from_iterable(LANGUAGE_CODE_ALIASES.get(lang, ()) for lang in languages)
+    return list(dict.fromkeys(chain(languages, aliases)))
 
 
 # Default language fallback chains (can be overridden via config)
@@ -411,6 +467,8 @@ def apply_language_fallbacks(
     Returns:
         Dict with labels for all requested languages (using fallbacks where needed).
     """
+    if fallbacks is None:
+        fallbacks = DEFAULT_LANGUAGE_FALLBACKS
     result: dict[str, str] = {}
 
     for lang in requested_languages:
@@ -418,9 +476,10 @@ def apply_language_fallbacks(
             # Direct match
             result[lang] = labels[lang]
         else:
-            # Try fallback chain
-            chain = get_fallback_chain(lang, fallbacks, final_fallback)
-            for fallback_lang in chain[1:]:  # Skip first (it's the same as lang)
+            # Walk the fallback chain (minus lang itself) without building it as
+            # a list; re-checking final_fallback when it is also a listed
+            # fallback is harmless.
+            for fallback_lang in chain(fallbacks.get(lang, ()), (final_fallback,)):
                 if fallback_lang in labels:
                     result[lang] = labels[fallback_lang]
                     logger.debug("Using %s fallback for %s", fallback_lang, lang)
@@ -429,7 +488,9 @@ def apply_language_fallbacks(
     return result
 
 
-@dataclass
+# Slotted because vocabularies hold thousands of concepts.  Not frozen —
+# hierarchy inference and tingbok enrichment update concepts in place.
+@dataclass(slots=True)
 class Concept:
     """A SKOS concept with labels and hierarchy."""
 
@@ -449,6 +510,11 @@ class Concept:
     excluded_sources: list[str] = field(default_factory=list)  # sources checked and rejected
     path_aliases: dict[str, list[str]] = field(default_factory=dict)  # lang -> [alias paths]
 
+    def __post_init__(self) -> None:
+        # A handful of source names are shared by every concept; parsed JSON/YAML
+        # would otherwise give each concept its own copy.
+        self.source = _intern(self.source)
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
         result = {
@@ -482,14 +548,8 @@ class Concept:
     def get_alt_labels(self, lang: str | None = None) -> list[str]:
         """Get altLabels for a specific language, or all if lang is None."""
         if lang is None:
-            seen: set[str] = set()
-            result: list[str] = []
-            for labels in self.altLabels.values():
-                for label in labels:
-                    if label not in seen:
-                        seen.add(label)
-                        result.append(label)
-            return result
+            # dict.fromkeys deduplicates while keeping first-seen order
+            return list(dict.fromkeys(chain.from_iterable(self.altLabels.values())))
         return list(self.altLabels.get(lang, []))
 
     def get_all_alt_labels_flat(self) -> list[str]:
@@ -563,11 +623,13 @@ def load_local_vocabulary(path: Path, default_source: str = "local") -> dict[str
                 raise ImportError(
                     "PyYAML required for .yaml vocabulary files. Install with: pip install inventory-md[yaml]"
                 ) from e
+            # Prefer the libyaml-backed loader when PyYAML was built with it;
+            # it is an order of magnitude faster than the pure-Python SafeLoader.
+            loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
             with open(path, encoding="utf-8") as f:
-                data = yaml.safe_load(f) or {}
+                data = yaml.load(f, Loader=loader) or {}
         else:
-            with open(path, encoding="utf-8") as f:
-                data = json.load(f)
+            data = _json_loads(path.read_bytes())
     except Exception as e:
         logger.warning("Failed to load vocabulary from %s: %s", path, e)
         return {}
@@ -604,6 +666,10 @@ def load_local_vocabulary(path: Path, default_source: str = "local") -> dict[str
         if isinstance(narrower, str):
             narrower = [narrower]
 
+        concept_id = _intern(concept_id)
+        broader = [_intern(b) for b in broader]
+        narrower = [_intern(n) for n in narrower]
+
         # Handle labels dict for translations
         labels = concept_data.get("labels", {})
 
@@ -649,7 +715,9 @@ def build_label_index(concepts: dict[str, Concept]) -> dict[str, str]:
     """Build an index mapping all labels to concept IDs.
 
     Includes prefLabel and all altLabels, lowercased for case-insensitive lookup.
-    Result is cached by dict identity — valid as long as concepts is not mutated.
+    Result is cached by dict identity and rebuilt when the number of concepts
+    changes, so adding concepts invalidates it; in-place edits of existing
+    concepts do not.
 
     Args:
         concepts: Dictionary of concepts.
@@ -658,15 +726,16 @@ def build_label_index(concepts: dict[str, Concept]) -> dict[str, str]:
         Dictionary mapping lowercase labels to concept IDs.
     """
     key = id(concepts)
-    if key in _label_index_cache:
-        return _label_index_cache[key]
-    index = {}
-    for concept_id, concept in concepts.items():
-        index[concept.prefLabel.lower()] = concept_id
-        for alt_label in concept.get_all_alt_labels_flat():
-            index[alt_label.lower()] = concept_id
-        index[concept_id.lower()] = concept_id
-    _label_index_cache[key] = index
+    cached = _label_index_cache.get(key)
+    if cached is not None and cached[0] == len(concepts):
+        return cached[1]
+    # prefLabel, then altLabels, then the ID itself — later entries win on collision.
+    index = {
+        label.lower(): concept_id
+        for concept_id, concept in concepts.items()
+        for label in chain((concept.prefLabel,), *concept.altLabels.values(), (concept_id,))
+    }
+    _label_index_cache[key] = (len(concepts), index)
     return index
 
 
@@ -680,15 +749,12 @@ def lookup_concept(label: str, vocabulary: dict[str, Concept]) -> Concept | None
     Returns:
         Concept if found, None otherwise.
     """
-    label_lower = label.lower()
-
     # First, check if label matches a concept ID directly
     if label in vocabulary:
         return vocabulary[label]
 
-    # Build label index and search
-    index = build_label_index(vocabulary)
-    concept_id = index.get(label_lower)
+    # Search the (cached) lowercased label index
+    concept_id = build_label_index(vocabulary).get(label.lower())
 
     if concept_id:
         return vocabulary.get(concept_id)
@@ -717,7 +783,6 @@ def is_descendant_of(
     concept_id: str,
     ancestor_id: str,
     vocabulary: dict[str, Concept],
-    _visited: set[str] | None = None,
 ) -> bool:
     """Return True if ``concept_id`` is ``ancestor_id`` or a transitive descendant of it.
 
@@ -728,14 +793,39 @@ def is_descendant_of(
     """
     if concept_id == ancestor_id:
         return True
-    visited = _visited if _visited is not None else set()
-    if concept_id in visited:
-        return False
-    visited.add(concept_id)
-    concept = vocabulary.get(concept_id)
-    if not concept:
-        return False
-    return any(is_descendant_of(b, ancestor_id, vocabulary, visited) for b in concept.broader)
+    return ancestor_id in _get_ancestors(concept_id, vocabulary)
+
+
+def _get_ancestors(concept_id: str, vocabulary: dict[str, Concept]) -> frozenset[str]:
+    """All IDs reachable from ``concept_id`` via ``broader`` links.
+
+    Memoized per concept; the memo is cached like :func:`build_label_index`, so
+    in-place edits of existing ``broader`` lists are not picked up.
+    """
+    key = id(vocabulary)
+    cached = _ancestor_cache.get(key)
+    if cached is None or cached[0] != len(vocabulary):
+        cached = (len(vocabulary), {})
+        _ancestor_cache[key] = cached
+    memo = cached[1]
+    ancestors = memo.get(concept_id)
+    if ancestors is not None:
+        return ancestors
+
+    # Iterative walk: no recursion limit on deep chains, and the seen set
+    # stops cycles and shared ancestors (diamonds) from being walked twice.
+    seen: set[str] = set()
+    stack = [concept_id]
+    while stack:
+        concept = vocabulary.get(stack.pop())
+        if concept is None:
+            continue
+        for broader_id in concept.broader:
+            if broader_id not in seen:
+                seen.add(broader_id)
+                stack.append(broader_id)
+    ancestors = memo[concept_id] = frozenset(seen)
+    return ancestors
 
 
 def get_narrower_concepts(concept: Concept, vocabulary: dict[str, Concept]) -> list[Concept]:
@@ -767,24 +857,21 @@ def _infer_hierarchy(concepts: dict[str, Concept]) -> None:
     Args:
         concepts: Dictionary of concepts to update.
     """
-    # Sort by path depth to process parents before children
-    concept_ids = sorted(concepts.keys(), key=lambda x: x.count("/"))
-
-    for concept_id in concept_ids:
-        concept = concepts[concept_id]
-
+    # A single pass in dict order is enough: each step only touches the concept
+    # and its direct parent, and siblings (all at the same depth) are appended
+    # to the parent's narrower list in dict order either way.
+    for concept_id, concept in concepts.items():
         # Infer parent from path
-        if "/" in concept_id:
-            parent_id = "/".join(concept_id.split("/")[:-1])
-            if parent_id and parent_id in concepts:
-                # Set broader if not already set from SKOS
-                if not concept.broader:
-                    concept.broader = [parent_id]
-                # ALWAYS add this concept to parent's narrower list
-                # This ensures the path hierarchy is preserved for navigation
-                parent = concepts[parent_id]
-                if concept_id not in parent.narrower:
-                    parent.narrower.append(concept_id)
+        parent_id = concept_id.rpartition("/")[0]
+        if parent_id and parent_id in concepts:
+            # Set broader if not already set from SKOS
+            if not concept.broader:
+                concept.broader = [parent_id]
+            # ALWAYS add this concept to parent's narrower list
+            # This ensures the path hierarchy is preserved for navigation
+            parent = concepts[parent_id]
+            if concept_id not in parent.narrower:
+                parent.narrower.append(concept_id)
 
 
 def create_broader_stubs(concepts: dict[str, Concept]) -> None:
@@ -801,15 +888,18 @@ def create_broader_stubs(concepts: dict[str, Concept]) -> None:
         for broader_id in concept.broader:
             if broader_id not in concepts:
                 to_create.add(broader_id)
-                parts = broader_id.split("/")
-                for i in range(1, len(parts)):
-                    anc = "/".join(parts[:i])
+                # Each "/" ends an ancestor prefix
+                end = broader_id.find("/")
+                while end != -1:
+                    anc = broader_id[:end]
                     if anc not in concepts:
                         to_create.add(anc)
+                    end = broader_id.find("/", end + 1)
 
     for stub_id in sorted(to_create, key=lambda x: x.count("/")):
-        label = stub_id.split("/")[-1].replace("_", " ").title()
-        broader = ["/".join(stub_id.split("/")[:-1])] if "/" in stub_id else []
+        parent_id, sep, leaf = stub_id.rpartition("/")
+        label = leaf.replace("_", " ").title()
+        broader = [parent_id] if sep else []
         concepts[stub_id] = Concept(
             id=stub_id,
             prefLabel=label,
@@ -860,7 +950,9 @@ def _add_category_by_source_nodes(concepts: dict[str, Concept]) -> None:
         if cid.startswith(CATEGORY_BY_SOURCE_ID):
             continue
         for src in concept.source_uris:
-            src_root = f"{CATEGORY_BY_SOURCE_ID}/{src}"
+            # Interned: every concept from a source rebuilds the same node IDs,
+            # which end up as dict keys and in broader/narrower lists.
+            src_root = sys.intern(f"{CATEGORY_BY_SOURCE_ID}/{src}")
             source_node_ids.add(src_root)
             src_path = concept.source_paths.get(src)
 
@@ -868,17 +960,16 @@ def _add_category_by_source_nodes(concepts: dict[str, Concept]) -> None:
                 # Build intermediate virtual nodes along the source path.
                 # Prefix all nodes with category_by_source/{src}/ so they
                 # don't collide with the main vocabulary tree.
-                parts = src_path.split("/")
-                for depth in range(1, len(parts)):
-                    segment = parts[depth - 1]
-                    node_id = src_root + "/" + "/".join(parts[:depth])
-                    parent_id = src_root if depth == 1 else src_root + "/" + "/".join(parts[: depth - 1])
+                # Each node ID extends its parent's by one segment.
+                parent_id = src_root
+                for segment in src_path.split("/")[:-1]:
+                    node_id = sys.intern(parent_id + "/" + segment)
                     _ensure_source_path_node(node_id, concepts, segment.replace("_", " ").title(), parent_id)
                     source_node_ids.add(node_id)
+                    parent_id = node_id
 
                 # The leaf: place cid under the deepest intermediate node
-                leaf_parent_id = src_root + "/" + "/".join(parts[:-1])
-                parent_node = concepts[leaf_parent_id]
+                parent_node = concepts[parent_id]
                 if cid not in parent_node.narrower:
                     parent_node.narrower.append(cid)
             else:
@@ -899,7 +990,7 @@ def _add_category_by_source_nodes(concepts: dict[str, Concept]) -> None:
     # Ensure top-level source nodes have correct label/broader
     for src_root in source_node_ids:
         if src_root.count("/") == 1:  # direct child of category_by_source
-            src = src_root.split("/", 1)[1]
+            src = src_root.partition("/")[2]
             _ensure_source_path_node(
                 src_root,
                 concepts,
@@ -926,6 +1017,11 @@ def build_category_tree(vocabulary: dict[str, Concept], infer_hierarchy: bool =
     Returns:
         CategoryTree with roots and label index.
     """
+    # The virtual root only contributes its narrower list (the curated root
+    # order), so read that directly instead of copying it as a concept.
+    virtual_root = vocabulary.get(VIRTUAL_ROOT_ID)
+    root_order = list(virtual_root.narrower) if virtual_root is not None else None
+
     # Make a copy to avoid modifying the original
     concepts = {
         k: Concept(
@@ -945,6 +1041,7 @@ def build_category_tree(vocabulary: dict[str, Concept], infer_hierarchy: bool =
             path_aliases={lang: list(aliases) for lang, aliases in v.path_aliases.items()},
         )
         for k, v in vocabulary.items()
+        if k != VIRTUAL_ROOT_ID
     }
 
     if infer_hierarchy:
@@ -953,14 +1050,22 @@ def build_category_tree(vocabulary: dict[str, Concept], infer_hierarchy: bool =
     create_broader_stubs(concepts)
     _add_category_by_source_nodes(concepts)
 
+    # Concepts declaring broader: [_root] get a stub _root from
+    # create_broader_stubs(); its narrower list joins the whitelist, and it is
+    # used as the whitelist on its own when the input had no _root entry.
+    stub = concepts.pop(VIRTUAL_ROOT_ID, None)
+    if stub is not None:
+        if root_order is None:
+            root_order = list(stub.narrower)
+        else:
+            root_order.extend(cid for cid in stub.narrower if cid not in root_order)
+
     # Find roots - concepts that should appear at the top level of the tree
-    if VIRTUAL_ROOT_ID in concepts:
+    if root_order is not None:
         # Virtual root defines explicit roots via its narrower list.
         # This is a whitelist: only concepts named in _root.narrower appear at
         # the top of the tree.  External/orphaned concepts are excluded.
-        virtual_root = concepts[VIRTUAL_ROOT_ID]
-        roots = [cid for cid in virtual_root.narrower if cid in concepts]
-        del concepts[VIRTUAL_ROOT_ID]
+        roots = [cid for cid in root_order if cid in concepts]
     else:
         # Fallback: infer roots from concepts with no broader and no "/"
         roots = [cid for cid, c in concepts.items() if "/" not in cid and not c.broader]
@@ -1004,11 +1109,9 @@ def resolve_category(
         return alias_map[cat_lower]
 
     # 3. Leaf name lookup (last path component of concept ID)
-    for concept_id in concepts:
-        if concept_id.startswith(CATEGORY_BY_SOURCE_ID + "/"):
-            continue
-        if concept_id.split("/")[-1] == cat_lower:
-            return concept_id
+    matched = _build_leaf_index(concepts).get(cat_lower)
+    if matched is not None:
+        return matched
 
     # 4. prefLabel / altLabel index.  Tingbok folds synonym and singular/plural
     # variants of a category into the canonical concept's altLabels (e.g.
@@ -1022,6 +1125,23 @@ def resolve_category(
     return None
 
 
+def _build_leaf_index(concepts: dict[str, Concept]) -> dict[str, str]:
+    """Map the last path component of each concept ID to the first ID ending in it.
+
+    ``category_by_source`` nodes are left out.  Cached like :func:`build_label_index`.
+    """
+    key = id(concepts)
+    cached = _leaf_index_cache.get(key)
+    if cached is not None and cached[0] == len(concepts):
+        return cached[1]
+    index: dict[str, str] = {}
+    for concept_id in concepts:
+        if not concept_id.startswith(CATEGORY_BY_SOURCE_ID + "/"):
+            index.setdefault(concept_id.rpartition("/")[2], concept_id)
+    _leaf_index_cache[key] = (len(concepts), index)
+    return index
+
+
 def _build_path_alias_map(vocab: dict[str, Concept], lang: str) -> dict[str, str]:
     """Build a reverse map from alias path (lower) to canonical concept ID.
 
@@ -1124,10 +1244,15 @@ def build_vocabulary_from_inventory(
     alias_map = _build_path_alias_map(concepts, lang)
     altlabel_index = _build_altlabel_index(concepts, lang)
 
-    # Add all category paths from inventory items
+    # Add all category paths from inventory items.  The same path typically
+    # appears on many items; resolving it once is enough.
+    seen: set[str] = set()
     for container in inventory_data.get("containers", []):
         for item in container.get("items", []):
             for category_path in item.get("metadata", {}).get("categories", []):
+                if category_path in seen:
+                    continue
+                seen.add(category_path)
                 path_lower = category_path.lower()
 
                 # 1. Full path_alias wins
@@ -1137,7 +1262,7 @@ def build_vocabulary_from_inventory(
                     continue
 
                 # 2. Root altLabel resolution
-                root = path_lower.split("/")[0]
+                root = path_lower.partition("/")[0]
                 canonical_root = altlabel_index.get(root)
                 if canonical_root:
                     _add_category_path(concepts, category_path, root_alias=canonical_root)
@@ -1175,19 +1300,20 @@ def _add_category_path(
         path: Category path to add.
         root_alias: Canonical concept ID that the first path component aliases.
     """
-    parts = path.split("/")
+    end = -1  # index of the "/" terminating the current prefix (or len(path))
+    for i, part in enumerate(path.split("/")):
+        end += len(part) + 1
 
-    for i in range(len(parts)):
         # Skip creating a concept for the aliased root component
         if i == 0 and root_alias is not None:
             continue
 
-        concept_id = "/".join(parts[: i + 1])
+        concept_id = sys.intern(path[:end])
         if concept_id not in concepts:
             # Create a concept with default prefLabel from the last part
             concepts[concept_id] = Concept(
                 id=concept_id,
-                prefLabel=parts[i].replace("-", " ").replace("_", " ").title(),
+                prefLabel=part.replace("-", " ").replace("_", " ").title(),
                 source="inventory",
             )
 
@@ -1218,8 +1344,13 @@ def save_vocabulary_json(
     if category_mappings:
         output_data["categoryMappings"] = category_mappings
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(output_data, f, ensure_ascii=False, indent=2)
+    # orjson (optional, inventory-md[fast]) emits the same indented UTF-8 JSON
+    # several times faster.  Otherwise serialise in one go and hand the text to
+    # a single write(): json.dump() would push every token through write().
+    if _orjson is not None:
+        output_path.write_bytes(_orjson.dumps(output_data, option=_orjson.OPT_INDENT_2))
+    else:
+        output_path.write_text(json.dumps(output_data, ensure_ascii=False, indent=2), encoding="utf-8")
 
 
 def count_items_per_category(inventory_data: dict[str, Any]) -> dict[str, int]:
@@ -1231,19 +1362,25 @@ def count_items_per_category(inventory_data: dict[str, Any]) -> dict[str, int]:
     Returns:
         Dictionary mapping category paths to item counts.
     """
-    counts: dict[str, int] = {}
+    # Count each distinct category path first, then propagate the totals up
+    # the path prefixes once per distinct path rather than once per item.
+    path_counts = Counter(
+        category_path
+        for container in inventory_data.get("containers", [])
+        for item in container.get("items", [])
+        for category_path in item.get("metadata", {}).get("categories", [])
+    )
 
-    for container in inventory_data.get("containers", []):
-        for item in container.get("items", []):
-            categories = item.get("metadata", {}).get("categories", [])
-            for category_path in categories:
-                # Count the category itself
-                counts[category_path] = counts.get(category_path, 0) + 1
-                # Also count all parent categories
-                parts = category_path.split("/")
-                for i in range(len(parts) - 1):
-                    parent_path = "/".join(parts[: i + 1])
-                    counts[parent_path] = counts.get(parent_path, 0) + 1
+    counts: dict[str, int] = {}
+    for category_path, n in path_counts.items():
+        # Count the category itself
+        counts[category_path] = counts.get(category_path, 0) + n
+        # Also count all parent categories
+        sep = category_path.find("/")
+        while sep != -1:
+            parent_path = category_path[:sep]
+            counts[parent_path] = counts.get(parent_path, 0) + n
+            sep = category_path.find("/", sep + 1)
 
     return counts
 
@@ -1259,6 +1396,7 @@ def resolve_categories_via_tingbok(
 
     For each label, queries tingbok's ``/api/skos/hierarchy`` endpoint across
     multiple SKOS sources.  Stops at the first source that finds the concept.
+    Labels are resolved concurrently; results are merged in input order.
 
     Args:
         unknown_labels: Category labels to resolve (e.g. ``["cumin", "bouillon"]``).
@@ -1285,7 +1423,7 @@ def resolve_categories_via_tingbok(
     new_concepts: dict[str, Concept] = {}
     category_mappings: dict[str, list[str]] = {}
 
-    for label in unknown_labels:
+    def _resolve(label: str) -> list[str] | None:
         for source in sources:
             try:
                 response = getter(
@@ -1300,11 +1438,28 @@ def resolve_categories_via_tingbok(
                 continue
 
             if data.get("found") and data.get("paths"):
-                paths: list[str] = data["paths"]
-                category_mappings[label.lower()] = paths
-                for path in paths:
-                    _add_category_path(new_concepts, path)
-                break  # Found in this source — skip remaining sources
+                return data["paths"]  # Found in this source — skip remaining sources
+        return None
+
+    # Resolve each distinct label once; a repeat would only redo the same
+    # requests and re-add the same paths.
+    labels = list(dict.fromkeys(unknown_labels))
+
+    # The requests are network-bound, so threads overlap them despite the GIL.
+    # Merging stays on this thread, in label order, so results are deterministic.
+    executor = ThreadPoolExecutor(max_workers=_RESOLVE_MAX_WORKERS)
+    try:
+        results = list(executor.map(_resolve, labels))
+    finally:
+        # As in enrich_categories_via_lookup(): on an early exit (e.g. Ctrl-C)
+        # drop the queued requests and don't wait for the ones in flight.
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    for label, paths in zip(labels, results, strict=True):
+        if paths:
+            category_mappings[label.lower()] = paths
+            for path in paths:
+                _add_category_path(new_concepts, path)
 
     return new_concepts, category_mappings
 
@@ -1347,70 +1502,93 @@ def enrich_categories_via_lookup(
     new_concepts: dict[str, Concept] = {}
     category_mappings: dict[str, list[str]] = {}
 
-    total = len(labels)
-    for i, label in enumerate(labels, 1):
-        print(f"   [{i}/{total}] Looking up {label!r} ...", end=" ", flush=True)
+    def _query_label(label: str) -> str:
         # Normalize the query label for SKOS sources: use the leaf node of a path,
         # replace hyphens with spaces, and strip OFF-style language tag prefixes
         # (e.g. "en:mashed-vegetables" → "mashed vegetables", "sk:džem" → "džem").
-        query_label = label.split("/")[-1].replace("-", " ").replace("_", " ").strip()
-        query_label = re.sub(r"^[a-z]{2,3}:", "", query_label)
-        if not query_label:
-            query_label = label
+        query_label = label.rpartition("/")[2].replace("-", " ").replace("_", " ").strip()
+        return _LANG_TAG_PREFIX_RE.sub("", query_label) or label
 
-        data: dict | None = None
+    def _fetch(query_label: str) -> tuple[dict | None, bool]:
+        """Return ``(data, from_cache)``; *data* is None on 404.  Raises on network errors."""
+        cache_path = None
         if cache_dir is not None:
-            cache_key = re.sub(r"[^\w.-]", "_", query_label)
+            cache_key = _CACHE_KEY_UNSAFE_RE.sub("_", query_label)
             cache_path = cache_dir / f"lookup_{cache_key}.json"
             entry = _cache_read(cache_path, _LOOKUP_CACHE_TTL_DAYS)
-            if entry is not None:
-                data = entry.get("data")
-                print("(cached)", end=" ", flush=True)
+            if entry is not None and entry.get("data") is not None:
+                return entry["data"], True
+        response = getter(f"{base}/api/lookup/{query_label}", params={"lang": lang}, timeout=120.0)
+        if response.status_code == 404:
+            if cache_path is not None:
+                _cache_write(cache_path, data=None)
+            return None, False
+        response.raise_for_status()
+        data = response.json()
+        if cache_path is not None:
+            _cache_write(cache_path, data=data)
+        return data, False
+
+    query_labels = [_query_label(label) for label in labels]
+    # Lookups are network-bound (tingbok fans out to several SKOS sources), so
+    # run them concurrently.  Different labels often normalise to the same
+    # query (e.g. "potatoes" and "food/potatoes"); each is fetched only once.
+    # Results are consumed in label order, so output and merging stay sequential.
+    executor = ThreadPoolExecutor(max_workers=_LOOKUP_MAX_WORKERS)
+    try:
+        futures = {q: executor.submit(_fetch, q) for q in dict.fromkeys(query_labels)}
+        consumed: set[str] = set()
 
-        if data is None:
+        total = len(labels)
+        for i, (label, query_label) in enumerate(zip(labels, query_labels, strict=True), 1):
+            print(f"   [{i}/{total}] Looking up {label!r} ...", end=" ", flush=True)
             try:
-                response = getter(f"{base}/api/lookup/{query_label}", params={"lang": lang}, timeout=120.0)
-                if response.status_code == 404:
-                    print("not found")
-                    logger.debug("No lookup result for %r", label)
-                    if cache_dir is not None:
-                        _cache_write(cache_path, data=None)
-                    continue
-                response.raise_for_status()
-                data = response.json()
-                if cache_dir is not None:
-                    _cache_write(cache_path, data=data)
+                data, from_cache = futures[query_label].result()
             except Exception as exc:
                 print(f"error: {exc}")
                 logger.debug("Concept lookup failed for %r: %s", label, exc)
                 continue
+            if data is None:
+                print("not found")
+                logger.debug("No lookup result for %r", label)
+                continue
+            if from_cache or query_label in consumed:
+                print("(cached)", end=" ", flush=True)
+            consumed.add(query_label)
 
-        concept_id: str = data.get("id", label)
-        print(f"→ {concept_id}")
-
-        # Convert VocabularyConcept format → Concept (same as fetch_vocabulary_from_tingbok)
-        data["altLabels"] = data.pop("altLabel", {})
-        data["id"] = concept_id
-        data["source"] = "tingbok"
-        raw_source_uris: list[str] = data.pop("source_uris", [])
-        try:
-            concept = Concept.from_dict(data)
-        except Exception as exc:
-            logger.warning("Skipping malformed lookup response for %r: %s", label, exc)
-            continue
-        for u in raw_source_uris:
-            src = _uri_to_source(u)
-            if src and src not in concept.source_uris:
-                concept.source_uris[src] = u
-
-        # Ensure all path segments exist (unenriched stubs for intermediates)
-        _add_category_path(new_concepts, concept_id)
-        # Overwrite the leaf with the fully enriched concept
-        new_concepts[concept_id] = concept
+            concept_id: str = data.get("id", label)
+            print(f"→ {concept_id}")
 
-        # Record mapping if a bare label resolved to a different (path-based) ID
-        if label.lower() != concept_id.lower() and "/" not in label:
-            category_mappings[label.lower()] = [concept_id]
+            # Convert VocabularyConcept format → Concept (same as fetch_vocabulary_from_tingbok)
+            data = dict(data)  # shallow copy — the response may be reused for a later label
+            data["altLabels"] = data.pop("altLabel", {})
+            data["id"] = concept_id
+            data["source"] = "tingbok"
+            raw_source_uris: list[str] = data.pop("source_uris", [])
+            try:
+                concept = Concept.from_dict(data)
+            except Exception as exc:
+                logger.warning("Skipping malformed lookup response for %r: %s", label, exc)
+                continue
+            for u in raw_source_uris:
+                src = _uri_to_source(u)
+                if src:
+                    concept.source_uris.setdefault(src, u)  # first URI per source wins
+
+            # Ensure all path segments exist (unenriched stubs for intermediates)
+            _add_category_path(new_concepts, concept_id)
+            # Overwrite the leaf with the fully enriched concept
+            new_concepts[concept_id] = concept
+
+            # Record mapping if a bare label resolved to a different (path-based) ID
+            if label.lower() != concept_id.lower() and "/" not in label:
+                category_mappings[label.lower()] = [concept_id]
+    finally:
+        # Every future has been consumed on a normal return, so this only matters
+        # on an early exit (e.g. Ctrl-C): drop the queued lookups and return
+        # without waiting for the ones in flight.  Their worker threads are still
+        # joined at interpreter exit, bounded by the per-request timeout.
+        executor.shutdown(wait=False, cancel_futures=True)
 
     return new_concepts, category_mappings
 
@@ -1494,7 +1672,7 @@ def ean_observation_needed(
     if product is None:
         return bool(categories or name or quantity or prices)
 
-    existing_cats: list[str] = product.get("categories") or []
+    existing_cats = set(product.get("categories") or [])
     if any(c not in existing_cats for c in categories):
         return True
 
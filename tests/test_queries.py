@@ -341,3 +341,23 @@ class TestIsDescendantOf:
     def test_not_a_descendant(self):
         concepts = {cid: vocabulary.Concept.from_dict(c) for cid, c in FOOD_VOCAB["concepts"].items()}
         assert not vocabulary.is_descendant_of("fender", "food", concepts)
+
+    def test_broader_cycle_terminates(self):
+        concepts = {
+            "a": vocabulary.Concept(id="a", prefLabel="A", broader=["b"]),
+            "b": vocabulary.Concept(id="b", prefLabel="B", broader=["a"]),
+        }
+        assert not vocabulary.is_descendant_of("a", "food", concepts)
+
+    def test_chain_deeper_than_recursion_limit(self):
+        concepts = {
+            f"c{i}": vocabulary.Concept(id=f"c{i}", prefLabel="C", broader=[f"c{i - 1}"]) for i in range(1, 5000)
+        }
+        assert vocabulary.is_descendant_of("c4999", "c0", concepts)
+
+    def test_ancestors_memoized_until_concepts_added(self):
+        concepts = {cid: vocabulary.Concept.from_dict(c) for cid, c in FOOD_VOCAB["concepts"].items()}
+        first = vocabulary._get_ancestors("food/legumes/soy-beans", concepts)
+        assert vocabulary._get_ancestors("food/legumes/soy-beans", concepts) is first
+        concepts["tofu"] = vocabulary.Concept(id="tofu", prefLabel="Tofu", broader=["food/legumes/soy-beans"])
+        assert vocabulary.is_descendant_of("tofu", "food", concepts)
@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
+import importlib.util
 import json
+import os
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from inventory_md import vocabulary
 
+requires_yaml = pytest.mark.skipif(importlib.util.find_spec("yaml") is None, reason="PyYAML not installed")
+
 
 class TestConcept:
     """Tests for Concept dataclass."""
@@ -109,13 +114,19 @@ class TestConcept:
         flat = concept.get_all_alt_labels_flat()
         assert flat == ["sport", "athletics", "idrett"]
 
+    def test_source_is_interned(self):
+        """Test that concepts parsed separately share one source string."""
+        a = vocabulary.Concept.from_dict(json.loads('{"id": "a", "source": "agrovoc"}'))
+        b = vocabulary.Concept.from_dict(json.loads('{"id": "b", "source": "agrovoc"}'))
+        assert a.source is b.source
+
 
 class TestLoadLocalVocabulary:
     """Tests for load_local_vocabulary function."""
 
+    @requires_yaml
     def test_load_yaml_vocabulary(self, tmp_path):
         """Test loading vocabulary from YAML file."""
-        pytest.importorskip("yaml")
         vocab_file = tmp_path / "local-vocabulary.yaml"
         vocab_file.write_text("""
 concepts:
@@ -158,6 +169,18 @@ concepts:
         assert vocab["boat-equipment"].prefLabel == "Boat equipment"
         assert vocab["boat-equipment"].narrower == ["boat-equipment/safety"]
 
+    def test_load_json_without_orjson(self, tmp_path, monkeypatch):
+        """Test that the stdlib JSON parser is used when orjson is unavailable."""
+        monkeypatch.setattr(vocabulary, "_orjson", None)
+        vocab_file = tmp_path / "local-vocabulary.json"
+        vocab_file.write_text(
+            json.dumps({"concepts": {"mat": {"prefLabel": "Mat", "altLabels": {"nb": ["føde"]}}}}, ensure_ascii=False),
+            encoding="utf-8",
+        )
+        vocab = vocabulary.load_local_vocabulary(vocab_file)
+
+        assert vocab["mat"].altLabels == {"nb": ["føde"]}
+
     def test_altlabels_roundtrip_through_to_dict(self, tmp_path):
         """altLabels written by Concept.to_dict (key 'altLabels') must load back.
 
@@ -184,9 +207,9 @@ concepts:
         vocab = vocabulary.load_local_vocabulary(vocab_file)
         assert vocab == {}
 
+    @requires_yaml
     def test_load_with_string_altlabel(self, tmp_path):
         """Test loading with altLabel as single string."""
-        pytest.importorskip("yaml")
         vocab_file = tmp_path / "vocab.yaml"
         vocab_file.write_text("""
 concepts:
@@ -197,9 +220,9 @@ concepts:
         vocab = vocabulary.load_local_vocabulary(vocab_file)
         assert vocab["potatoes"].altLabels == {"en": ["spuds"]}
 
+    @requires_yaml
     def test_load_with_string_broader(self, tmp_path):
         """Test loading with broader as single string."""
-        pytest.importorskip("yaml")
         vocab_file = tmp_path / "vocab.yaml"
         vocab_file.write_text("""
 concepts:
@@ -210,9 +233,9 @@ concepts:
         vocab = vocabulary.load_local_vocabulary(vocab_file)
         assert vocab["potatoes"].broader == ["vegetables"]
 
+    @requires_yaml
     def test_load_with_language_tagged_altlabels(self, tmp_path):
         """Test loading vocabulary with language-tagged dict altLabels."""
-        pytest.importorskip("yaml")
         vocab_file = tmp_path / "vocab.yaml"
         vocab_file.write_text("""
 concepts:
@@ -225,9 +248,9 @@ concepts:
         vocab = vocabulary.load_local_vocabulary(vocab_file)
         assert vocab["food"].altLabels == {"en": ["groceries", "provisions"], "nb": ["mat", "matvarer"]}
 
+    @requires_yaml
     def test_load_backward_compat_flat_altlabels(self, tmp_path):
         """Test that flat list altLabels are wrapped as en."""
-        pytest.importorskip("yaml")
         vocab_file = tmp_path / "vocab.yaml"
         vocab_file.write_text("""
 concepts:
@@ -238,9 +261,9 @@ concepts:
         vocab = vocabulary.load_local_vocabulary(vocab_file)
         assert vocab["tools"].altLabels == {"en": ["equipment", "implements"]}
 
+    @requires_yaml
     def test_load_dict_altlabel_string_values(self, tmp_path):
         """Test that dict altLabels with string values are wrapped in lists."""
-        pytest.importorskip("yaml")
         vocab_file = tmp_path / "vocab.yaml"
         vocab_file.write_text("""
 concepts:
@@ -253,6 +276,22 @@ concepts:
         vocab = vocabulary.load_local_vocabulary(vocab_file)
         assert vocab["food"].altLabels == {"en": ["groceries"], "nb": ["mat"]}
 
+    @requires_yaml
+    def test_load_yaml_without_libyaml(self, tmp_path, monkeypatch):
+        """Test that YAML loading falls back to SafeLoader when libyaml is missing."""
+        import yaml
+
+        monkeypatch.delattr(yaml, "CSafeLoader", raising=False)
+        vocab_file = tmp_path / "vocab.yaml"
+        vocab_file.write_text("""
+concepts:
+  potatoes:
+    prefLabel: "Potatoes"
+    altLabel: "spuds"
+""")
+        vocab = vocabulary.load_local_vocabulary(vocab_file)
+        assert vocab["potatoes"].altLabels == {"en": ["spuds"]}
+
 
 class TestLookupConcept:
     """Tests for lookup_concept function."""
@@ -367,6 +406,21 @@ class TestBuildCategoryTree:
         assert "food/vegetables" in tree.concepts["food"].narrower
         assert "food/vegetables/potatoes" in tree.concepts["food/vegetables"].narrower
 
+    def test_infer_hierarchy_children_before_parent(self):
+        """Test that children listed before their parent are still linked, in dict order."""
+        vocab = {
+            "food/vegetables/potatoes": vocabulary.Concept(id="food/vegetables/potatoes", prefLabel="Potatoes"),
+            "food/vegetables": vocabulary.Concept(id="food/vegetables", prefLabel="Vegetables"),
+            "food/fruit": vocabulary.Concept(id="food/fruit", prefLabel="Fruit"),
+            "food": vocabulary.Concept(id="food", prefLabel="Food"),
+        }
+        tree = vocabulary.build_category_tree(vocab, infer_hierarchy=True)
+
+        assert tree.roots == ["food"]
+        assert tree.concepts["food"].narrower == ["food/vegetables", "food/fruit"]
+        assert tree.concepts["food/vegetables"].narrower == ["food/vegetables/potatoes"]
+        assert tree.concepts["food/vegetables/potatoes"].broader == ["food/vegetables"]
+
     def test_explicit_broader_not_overridden(self):
         """Test that explicit broader relationships are not overridden."""
         vocab = {
@@ -520,6 +574,31 @@ class TestBuildCategoryTree:
         # Order matches _root.narrower, NOT alphabetical
         assert tree.roots == ["tools", "food", "electronics"]
 
+    def test_virtual_root_accepts_broader_references(self):
+        """Concepts with broader: [_root] are appended to the curated roots."""
+        vocab = {
+            "_root": vocabulary.Concept(id="_root", prefLabel="Root", narrower=["tools"]),
+            "tools": vocabulary.Concept(id="tools", prefLabel="Tools"),
+            "food": vocabulary.Concept(id="food", prefLabel="Food", broader=["_root"]),
+        }
+        tree = vocabulary.build_category_tree(vocab)
+
+        assert tree.roots == ["tools", "food"]
+        assert "_root" not in tree.concepts
+        assert vocab["_root"].narrower == ["tools"]
+
+    def test_broader_root_without_root_entry(self):
+        """Without a _root entry, the stub from broader: [_root] is the whitelist."""
+        vocab = {
+            "tools": vocabulary.Concept(id="tools", prefLabel="Tools"),
+            "food": vocabulary.Concept(id="food", prefLabel="Food", broader=["_root"]),
+        }
+        tree = vocabulary.build_category_tree(vocab)
+
+        assert tree.roots == ["food"]
+        assert "_root" not in tree.concepts
+        assert "_root" not in tree.label_index.values()
+
     def test_source_uris_preserved(self):
         """build_category_tree must preserve source_uris on concepts."""
         vocab = {
@@ -1047,6 +1126,37 @@ class TestSaveVocabularyJson:
 
         assert "categoryMappings" not in data
 
+    def test_save_large_vocabulary_roundtrip(self, tmp_path):
+        """Test that a large vocabulary survives a save/load round-trip intact."""
+        vocab = {"food": vocabulary.Concept(id="food", prefLabel="Food")}
+        for i in range(1000):
+            cid = f"food/item-{i}"
+            vocab[cid] = vocabulary.Concept(id=cid, prefLabel=f"Vare {i} æøå", altLabels={"nb": [f"vare{i}"]})
+        output_path = tmp_path / "vocabulary.json"
+        vocabulary.save_vocabulary_json(vocab, output_path)
+
+        loaded = vocabulary.load_local_vocabulary(output_path)
+        assert len(loaded) == 1001
+        assert loaded["food/item-999"].prefLabel == "Vare 999 æøå"
+        assert loaded["food/item-999"].altLabels == {"nb": ["vare999"]}
+        assert len(loaded["food"].narrower) == 1000
+
+    def test_save_output_identical_without_orjson(self, tmp_path, monkeypatch):
+        """Test that the stdlib fallback writes byte-identical JSON to the orjson path."""
+        vocab = {
+            "food": vocabulary.Concept(id="food", prefLabel="Mat", altLabels={"nb": ["føde"]}),
+            "food/vegetables": vocabulary.Concept(id="food/vegetables", prefLabel="Grønnsaker"),
+        }
+        mappings = {"grønnsak": ["food/vegetables"]}
+        default_path = tmp_path / "default.json"
+        vocabulary.save_vocabulary_json(vocab, default_path, category_mappings=mappings)
+
+        monkeypatch.setattr(vocabulary, "_orjson", None)
+        stdlib_path = tmp_path / "stdlib.json"
+        vocabulary.save_vocabulary_json(vocab, stdlib_path, category_mappings=mappings)
+
+        assert default_path.read_bytes() == stdlib_path.read_bytes()
+
 
 class TestLanguageFallbacks:
     """Tests for language fallback functionality."""
@@ -1676,15 +1786,36 @@ class TestResolveCategoriesViaTingbok:
 
         assert call_count == 1, "Should stop after first source finds the concept"
 
+    def test_multiple_labels_merged_in_input_order(self):
+        """Labels resolved concurrently are still merged in input order."""
+
+        def fake_get(url: str, params: dict, **kwargs: object) -> MagicMock:
+            label = params["label"]
+            return self._mock_response({"found": True, "paths": [f"food/{label}"]})
+
+        labels = ["cumin", "pepper", "salt", "thyme"]
+        with patch("niquests.get", side_effect=fake_get):
+            new_concepts, mappings = vocabulary.resolve_categories_via_tingbok(labels, self.TINGBOK_URL)
+
+        assert list(mappings) == labels
+        assert mappings["salt"] == ["food/salt"]
+        assert list(new_concepts) == ["food"] + [f"food/{label}" for label in labels]
+
+    def test_duplicate_labels_resolved_once(self):
+        """A label listed more than once is only sent to tingbok once."""
+        found_response = {"found": True, "paths": ["food/spices/cumin"]}
+        with patch("niquests.get", return_value=self._mock_response(found_response)) as mock_get:
+            _, mappings = vocabulary.resolve_categories_via_tingbok(["cumin", "cumin"], self.TINGBOK_URL)
+
+        assert mock_get.call_count == 1
+        assert mappings == {"cumin": ["food/spices/cumin"]}
+
 
 class TestFindVocabularyFiles:
     """Tests for find_vocabulary_files — file discovery and exclusion rules."""
 
     def test_generated_vocabulary_json_not_picked_up_from_cwd(self, tmp_path) -> None:
         """vocabulary.json in CWD (generated parse output) must not be used as input."""
-        import os
-        from pathlib import Path
-
         # Create a vocabulary.json that looks like generated output
         generated = tmp_path / "vocabulary.json"
         generated.write_text(
@@ -1706,9 +1837,6 @@ class TestFindVocabularyFiles:
 
     def test_local_vocabulary_json_is_accepted(self, tmp_path) -> None:
         """local-vocabulary.json in CWD should still be accepted as input."""
-        import os
-        from pathlib import Path
-
         local_vocab = tmp_path / "local-vocabulary.json"
         local_vocab.write_text('{"concepts": {}}', encoding="utf-8")
 
@@ -1724,9 +1852,6 @@ class TestFindVocabularyFiles:
 
     def test_vocabulary_yaml_in_cwd_is_accepted(self, tmp_path) -> None:
         """vocabulary.yaml in CWD should still be accepted (hand-crafted local vocab)."""
-        import os
-        from pathlib import Path
-
         vocab_yaml = tmp_path / "vocabulary.yaml"
         vocab_yaml.write_text("concepts: {}", encoding="utf-8")
 
@@ -1747,8 +1872,6 @@ class TestLookupEanViaTingbok:
     TINGBOK_URL = "https://tingbok.plann.no"
 
     def test_found_product_returns_dict(self) -> None:
-        from unittest.mock import MagicMock, patch
-
         product_data = {
             "ean": "7310865004703",
             "name": "Kalles Kaviar",
@@ -1771,8 +1894,6 @@ class TestLookupEanViaTingbok:
         assert "caviar spreads" in result["categories"]
 
     def test_not_found_returns_none(self) -> None:
-        from unittest.mock import MagicMock, patch
-
         mock_response = MagicMock()
         mock_response.status_code = 404
 
@@ -1782,16 +1903,12 @@ class TestLookupEanViaTingbok:
         assert result is None
 
     def test_network_error_returns_none(self) -> None:
-        from unittest.mock import patch
-
         with patch("niquests.get", side_effect=Exception("connection refused")):
             result = vocabulary.lookup_ean_via_tingbok("7310865004703", self.TINGBOK_URL)
 
         assert result is None
 
     def test_url_constructed_correctly(self) -> None:
-        from unittest.mock import MagicMock, patch
-
         mock_response = MagicMock()
         mock_response.status_code = 404
 
@@ -1804,8 +1921,6 @@ class TestLookupEanViaTingbok:
 
     def test_uses_session_get_when_provided(self) -> None:
         """When a session is passed, session.get() is used instead of niquests.get()."""
-        from unittest.mock import MagicMock
-
         mock_response = MagicMock()
         mock_response.status_code = 404
         mock_session = MagicMock()
@@ -1824,8 +1939,6 @@ class TestFetchVocabularySession:
 
     def test_uses_session_get_when_provided(self) -> None:
         """When a session is passed, session.get() is used instead of niquests.get()."""
-        from unittest.mock import MagicMock
-
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.json.return_value = {}
@@ -1846,8 +1959,6 @@ class TestResolveCategoriesSession:
 
     def test_uses_session_get_when_provided(self) -> None:
         """When a session is passed, session.get() is used instead of niquests.get()."""
-        from unittest.mock import MagicMock
-
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"found": False, "paths": []}
@@ -1866,8 +1977,6 @@ class TestLoadGlobalVocabularySession:
 
     def test_passes_session_to_fetch(self) -> None:
         """Session passed to load_global_vocabulary() is forwarded to fetch_vocabulary_from_tingbok()."""
-        from unittest.mock import MagicMock, patch
-
         mock_session = MagicMock()
 
         with patch.object(vocabulary, "fetch_vocabulary_from_tingbok", return_value={}) as mock_fetch:
@@ -1882,8 +1991,6 @@ class TestEnrichCategoriesViaLookup:
     TINGBOK_URL = "https://tingbok.plann.no"
 
     def _make_response(self, data: dict, status_code: int = 200):
-        from unittest.mock import MagicMock
-
         r = MagicMock()
         r.status_code = status_code
         r.json.return_value = data
@@ -1903,8 +2010,6 @@ class TestEnrichCategoriesViaLookup:
 
     def test_bare_label_resolves_to_path(self) -> None:
         """Bare label 'cumin' resolved to 'food/spices/cumin' recorded in category_mappings."""
-        from unittest.mock import patch
-
         with patch("niquests.get", return_value=self._make_response(self._vocab_concept("food/spices/cumin", "Cumin"))):
             new_concepts, mappings = vocabulary.enrich_categories_via_lookup(["cumin"], self.TINGBOK_URL)
 
@@ -1913,8 +2018,6 @@ class TestEnrichCategoriesViaLookup:
 
     def test_path_label_gets_enriched(self) -> None:
         """Full path 'food/spices/cumin' → enriched concept, no mapping entry."""
-        from unittest.mock import patch
-
         with patch("niquests.get", return_value=self._make_response(self._vocab_concept("food/spices/cumin", "Cumin"))):
             new_concepts, mappings = vocabulary.enrich_categories_via_lookup(["food/spices/cumin"], self.TINGBOK_URL)
 
@@ -1926,8 +2029,6 @@ class TestEnrichCategoriesViaLookup:
 
     def test_parent_paths_added(self) -> None:
         """All path segments of resolved concept are present in new_concepts."""
-        from unittest.mock import patch
-
         with patch("niquests.get", return_value=self._make_response(self._vocab_concept("food/spices/cumin", "Cumin"))):
             new_concepts, _ = vocabulary.enrich_categories_via_lookup(["cumin"], self.TINGBOK_URL)
 
@@ -1937,18 +2038,43 @@ class TestEnrichCategoriesViaLookup:
 
     def test_404_skips_label(self) -> None:
         """404 response → label absent from new_concepts."""
-        from unittest.mock import patch
-
         with patch("niquests.get", return_value=self._make_response({}, status_code=404)):
             new_concepts, mappings = vocabulary.enrich_categories_via_lookup(["xyzzy"], self.TINGBOK_URL)
 
         assert new_concepts == {}
         assert mappings == {}
 
+    def test_repeated_query_label_fetched_once(self) -> None:
+        """Labels normalising to the same query share one request and one result."""
+        with patch(
+            "niquests.get", return_value=self._make_response(self._vocab_concept("food/spices/cumin", "Cumin"))
+        ) as mock_get:
+            new_concepts, mappings = vocabulary.enrich_categories_via_lookup(
+                ["cumin", "food/cumin", "en:cumin"], self.TINGBOK_URL
+            )
+
+        assert mock_get.call_count == 1
+        assert new_concepts["food/spices/cumin"].get_alt_labels("en") == ["alt"]
+        assert mappings == {"cumin": ["food/spices/cumin"], "en:cumin": ["food/spices/cumin"]}
+
+    def test_concurrent_lookups_merged_in_label_order(self) -> None:
+        """Lookups run concurrently; a failing label does not affect the others."""
+
+        def fake_get(url: str, **kwargs: object):
+            leaf = url.rpartition("/")[2]
+            if leaf == "salt":
+                raise Exception("timeout")
+            return self._make_response(self._vocab_concept(f"food/{leaf}"))
+
+        labels = ["cumin", "salt", "pepper", "thyme"]
+        with patch("niquests.get", side_effect=fake_get):
+            new_concepts, mappings = vocabulary.enrich_categories_via_lookup(labels, self.TINGBOK_URL)
+
+        assert list(mappings) == ["cumin", "pepper", "thyme"]
+        assert list(new_concepts) == ["food", "food/cumin", "food/pepper", "food/thyme"]
+
     def test_network_error_skips_label(self) -> None:
         """Network exception → graceful skip."""
-        from unittest.mock import patch
-
         with patch("niquests.get", side_effect=Exception("connection refused")):
             new_concepts, mappings = vocabulary.enrich_categories_via_lookup(["cumin"], self.TINGBOK_URL)
 
@@ -1962,8 +2088,6 @@ class TestEnrichCategoriesViaLookup:
         concepts that were overwritten by these stubs (as parse_command does after
         calling enrich_categories_via_lookup).
         """
-        from unittest.mock import patch
-
         with patch(
             "niquests.get",
             return_value=self._make_response(self._vocab_concept("clothing/outdoor_clothing", "Outdoor Clothing")),
@@ -1978,8 +2102,6 @@ class TestEnrichCategoriesViaLookup:
 
     def test_uses_session_get_when_provided(self) -> None:
         """session.get() is used instead of niquests.get() when session is passed."""
-        from unittest.mock import MagicMock
-
         mock_session = MagicMock()
         mock_session.get.return_value = self._make_response(self._vocab_concept("food/spices/cumin", "Cumin"))
 
@@ -1991,8 +2113,6 @@ class TestEnrichCategoriesViaLookup:
 
     def test_altlabels_converted(self) -> None:
         """altLabel from VocabularyConcept (SKOS key) is stored in Concept.altLabels."""
-        from unittest.mock import patch
-
         data = self._vocab_concept("food/spices/cumin", "Cumin")
         data["altLabel"] = {"en": ["cummin", "jeera"]}
         with patch("niquests.get", return_value=self._make_response(data)):
@@ -2019,8 +2139,6 @@ class TestEanCache:
 
     def test_cache_miss_calls_network_and_saves(self, tmp_path) -> None:
         """On cache miss, network is called and result is saved to cache."""
-        from unittest.mock import MagicMock, patch
-
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.json.return_value = self._product()
@@ -2037,8 +2155,6 @@ class TestEanCache:
 
     def test_cache_hit_skips_network(self, tmp_path) -> None:
         """On cache hit (within TTL), network is not called."""
-        from unittest.mock import MagicMock, patch
-
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.json.return_value = self._product()
@@ -2057,8 +2173,6 @@ class TestEanCache:
 
     def test_no_cache_dir_always_calls_network(self, tmp_path) -> None:
         """When cache_dir is None, network is always called (backwards-compatible)."""
-        from unittest.mock import MagicMock, patch
-
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.json.return_value = self._product()
@@ -2071,8 +2185,6 @@ class TestEanCache:
 
     def test_put_invalidates_get_cache(self, tmp_path) -> None:
         """A successful PUT removes the GET cache so next lookup fetches fresh data."""
-        from unittest.mock import MagicMock, patch
-
         get_response = MagicMock()
         get_response.status_code = 200
         get_response.json.return_value = self._product()
@@ -2094,8 +2206,6 @@ class TestEanCache:
 
     def test_report_without_cache_dir_always_sends(self) -> None:
         """Without cache_dir, PUT is always sent (backwards-compatible)."""
-        from unittest.mock import MagicMock, patch
-
         put_response = MagicMock()
         put_response.status_code = 200
         put_response.json.return_value = self._product()
@@ -2171,8 +2281,6 @@ class TestLookupCache:
     TINGBOK_URL = "https://tingbok.plann.no"
 
     def _make_response(self, data: dict, status_code: int = 200):
-        from unittest.mock import MagicMock
-
         r = MagicMock()
         r.status_code = status_code
         r.json.return_value = data
@@ -2192,8 +2300,6 @@ class TestLookupCache:
 
     def test_cache_miss_calls_network_and_saves(self, tmp_path) -> None:
         """On cache miss, network is called and result is cached."""
-        from unittest.mock import patch
-
         with patch(
             "niquests.get", return_value=self._make_response(self._vocab_concept("food/spices/cumin"))
         ) as mock_get:
@@ -2205,8 +2311,6 @@ class TestLookupCache:
 
     def test_cache_hit_skips_network(self, tmp_path) -> None:
         """On cache hit, network is not called."""
-        from unittest.mock import patch
-
         response = self._make_response(self._vocab_concept("food/spices/cumin"))
         with patch("niquests.get", return_value=response):
             vocabulary.enrich_categories_via_lookup(["cumin"], self.TINGBOK_URL, cache_dir=tmp_path)
@@ -2217,10 +2321,17 @@ class TestLookupCache:
         mock_get2.assert_not_called()
         assert "food/spices/cumin" in new_concepts
 
+    def test_cache_write_leaves_no_temp_files(self, tmp_path) -> None:
+        """Labels sharing a cache file get one complete entry and no leftover temp files."""
+        response = self._make_response(self._vocab_concept("food/spices/cumin"))
+        with patch("niquests.get", return_value=response):
+            vocabulary.enrich_categories_via_lookup(["cumin seed", "cumin?seed"], self.TINGBOK_URL, cache_dir=tmp_path)
+
+        assert [p.name for p in tmp_path.iterdir()] == ["lookup_cumin_seed.json"]
+        assert json.loads((tmp_path / "lookup_cumin_seed.json").read_text())["data"]["id"] == "food/spices/cumin"
+
     def test_no_cache_dir_always_calls_network(self) -> None:
         """Without cache_dir, network is always called."""
-        from unittest.mock import patch
-
         response = self._make_response(self._vocab_concept("food/spices/cumin"))
         with patch("niquests.get", return_value=response) as mock_get:
             vocabulary.enrich_categories_via_lookup(["cumin"], self.TINGBOK_URL, cache_dir=None)
@@ -2415,6 +2526,13 @@ class TestBuildLabelIndexCache:
         assert idx["drink"] == "drink"
         assert idx["beverage"] == "drink"
 
+    def test_adding_concept_invalidates_cache(self):
+        concepts = self._make_concepts()
+        vocabulary.build_label_index(concepts)
+        concepts["tea"] = vocabulary.Concept(id="tea", prefLabel="Tea", altLabels={"en": ["chai"]})
+        assert vocabulary.build_label_index(concepts)["chai"] == "tea"
+        assert vocabulary.lookup_concept("CHAI", concepts) is concepts["tea"]
+
 
 class TestBuildPathAliasMapCache:
     """_build_path_alias_map returns cached object on repeated calls."""
@@ -2449,3 +2567,27 @@ class TestBuildPathAliasMapCache:
         m = vocabulary._build_path_alias_map(vocab, "en")
         assert m["food"] == "food"
         assert m["foods"] == "food"
+
+
+class TestBuildLeafIndexCache:
+    """_build_leaf_index backs resolve_category's leaf-name step."""
+
+    def _make_vocab(self) -> dict[str, vocabulary.Concept]:
+        return {
+            "category_by_source/off/potatoes": vocabulary.Concept(id="category_by_source/off/potatoes", prefLabel="P"),
+            "food/vegetables/potatoes": vocabulary.Concept(id="food/vegetables/potatoes", prefLabel="Potatoes"),
+            "garden/potatoes": vocabulary.Concept(id="garden/potatoes", prefLabel="Potatoes"),
+        }
+
+    def test_returns_same_object_on_second_call(self):
+        vocab = self._make_vocab()
+        assert vocabulary._build_leaf_index(vocab) is vocabulary._build_leaf_index(vocab)
+
+    def test_first_match_wins_and_category_by_source_skipped(self):
+        assert vocabulary.resolve_category("potatoes", self._make_vocab()) == "food/vegetables/potatoes"
+
+    def test_adding_concept_invalidates_cache(self):
+        vocab = self._make_vocab()
+        assert vocabulary.resolve_category("carrots", vocab) is None
+        vocab["food/vegetables/carrots"] = vocabulary.Concept(id="food/vegetables/carrots", prefLabel="Carrots")
+        assert vocabulary.resolve_category("carrots", vocab) == "food/vegetables/carrots"